@@ -0,0 +1,44 @@
+"""
+clearutils
+
+A toolbox for clear, modular, script-friendly helpers—no advanced Python required.
+"""
+
+__version__ = "0.1.0"
+__author__ = "Renya Wasson"
+__license__ = "MIT"
+
+# Optional: Import top-level helpers for easy access
+from clearutils.log import setup_logging, logw, logw_traceback, flush_logs
+
+# The formatting helpers pull in numpy and pandas, which are slow to import.
+# Load format_engine lazily (PEP 562) so scripts that only want the logging
+# helpers don't pay for it.
+_FORMAT_ALIASES = {
+    "format_currency": "format_currency",
+    "currency": "format_currency",
+    "curr": "format_currency",
+    "format_percent": "format_percent",
+    "percentage": "format_percent",
+    "per": "format_percent",
+    "get_supported_currency_symbols": "get_supported_currency_symbols",
+}
+
+
+def __getattr__(name):
+    target = _FORMAT_ALIASES.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from clearutils import format_engine
+
+    value = getattr(format_engine, target)
+    globals()[name] = value  # cache so later lookups skip __getattr__
+    return value
+
+
+# Optionally, set __all__ to control what gets imported with "from clearutils import *"
+__all__ = [
+    "setup_logging", "logw", "logw_traceback", "flush_logs",
+    "format_currency", "format_percent", "get_supported_currency_symbols",
+    "currency", "percentage", "curr", "per",
+]
@@ -0,0 +1,168 @@
+"""
+Optional Numba kernels for clearutils.format_engine.
+
+Numba is not a required dependency. When it is installed, format_engine routes
+bulk numeric inputs through the compiled kernel below; when it isn't, the
+plain Python paths are used instead. Fetch the kernel through `load_kernel()`
+so the (slow) numba import only happens on first use.
+
+Running `python tools/build_aot.py` ahead of time compiles the same kernel
+into a `_fmt_aot` extension module; when that is importable, `load_kernel()`
+uses it and skips JIT warmup on the first call entirely.
+"""
+
+import numpy as np
+
+# Signature shared by the JIT and AOT builds of the kernel. The kernel writes
+# UCS4 code points into a caller-allocated (n, _OUT_WIDTH) int32 buffer; the
+# wrapper views that buffer as fixed-width unicode, so no numba container
+# types cross the boundary (typed-list boxing would drag numba back in and
+# cost a Python call per element).
+KERNEL_SIGNATURE = (
+    "void(f8[:], i4, unicode_type, unicode_type, unicode_type, unicode_type, i4[:,:])"
+)
+
+# Sign + multi-char prefix + grouped int64 digits + separators + fraction.
+_OUT_WIDTH = 48
+
+# int64 scaling caps the fraction at 18 digits before `scale` overflows.
+_MAX_DIGIT = 18
+
+
+def kernel_fits(digit, prefix, suffix):
+    """True when `digit` and the affixes fit the kernel's fixed-width rows.
+
+    The kernel scales by 10**digit in int64 and writes into _OUT_WIDTH-wide
+    rows with bounds checking off, so the caller must fall back to the
+    Python path whenever either budget would be exceeded: sign + prefix +
+    up to 19 grouped integer digits (6 separators) + point + fraction +
+    suffix.
+    """
+    if digit > _MAX_DIGIT:
+        return False
+    return 1 + len(prefix) + 25 + 1 + digit + len(suffix) <= _OUT_WIDTH
+
+# Rows are independent, so formatting parallelizes trivially; below this size
+# thread launch costs more than it saves.
+_PARALLEL_CUTOVER = 100_000
+
+_kernel = None
+_parallel_kernel = None
+
+
+def kernel_impl(prange=None):
+    """Return the undecorated kernel for the JIT and AOT builds to compile.
+
+    Pass numba's `prange` to get the body of the parallel build; the default
+    serial body is what the AOT module compiles (pycc has no parallel=True).
+    """
+    rng = range if prange is None else prange
+
+    def format_fixed(vals, digit, prefix, suffix, thousands_sep, decimal_sep,
+                     out_codes):
+        # `vals` must already be rounded to `digit` places (digit clamped to
+        # >= 0 here); the caller owns the rounding so results match np.round.
+        # NaN rows are left zeroed, which the unicode view reads back as "".
+        n = vals.shape[0]
+        scale = 1
+        for _ in range(digit):
+            scale *= 10
+        for i in rng(n):
+            v = vals[i]
+            if v != v:  # NaN
+                continue
+            # signbit, not a compare: negatives that rounded to zero arrive
+            # as -0.0 and must keep their minus sign.
+            neg = np.signbit(v)
+            x = -v if neg else v
+            # v sits on the rounding grid already, so the +0.5 only undoes
+            # float representation error when scaling to an integer.
+            iv = int(x * scale + 0.5)
+            int_part = iv // scale
+            frac = iv - int_part * scale
+            if int_part == 0:
+                s = "0"
+            else:
+                s = ""
+                while int_part > 0:
+                    chunk = int_part % 1000
+                    int_part //= 1000
+                    cs = str(chunk)
+                    if int_part > 0:
+                        while len(cs) < 3:
+                            cs = "0" + cs
+                        s = thousands_sep + cs + s
+                    else:
+                        s = cs + s
+            if digit > 0:
+                fs = str(frac)
+                while len(fs) < digit:
+                    fs = "0" + fs
+                s = s + decimal_sep + fs
+            if neg:
+                s = "-" + prefix + s
+            else:
+                s = prefix + s
+            s = s + suffix
+            for j in range(len(s)):
+                out_codes[i, j] = ord(s[j])
+        return
+
+    return format_fixed
+
+
+def load_kernel():
+    """Return the compiled kernel, or None when numba is missing.
+
+    Prefers the AOT-built `_fmt_aot` module (no JIT warmup); otherwise JIT
+    compiles on first use, with numba's persistent on-disk cache.
+    """
+    global _kernel
+    if _kernel is None:
+        _kernel = _load()
+    return _kernel or None
+
+
+def _load():
+    try:
+        from clearutils import _fmt_aot
+        raw = _fmt_aot.format_fixed
+    except ImportError:
+        try:
+            from numba import njit
+        except ImportError:
+            return False
+        raw = njit(KERNEL_SIGNATURE, cache=True)(kernel_impl())
+
+    def format_fixed(vals, digit, prefix, suffix, thousands_sep, decimal_sep,
+                     _raw=raw):
+        run = _raw
+        if vals.shape[0] >= _PARALLEL_CUTOVER:
+            parallel = _load_parallel()
+            if parallel is not None:
+                run = parallel
+        out_codes = np.zeros((vals.shape[0], _OUT_WIDTH), dtype=np.int32)
+        run(vals, digit, prefix, suffix, thousands_sep, decimal_sep, out_codes)
+        return out_codes.view(f"U{_OUT_WIDTH}").ravel().tolist()
+
+    return format_fixed
+
+
+def _load_parallel():
+    """JIT the prange build on first use; None when numba is unavailable.
+
+    Only the serial kernel exists ahead of time (pycc cannot compile
+    parallel=True), so large arrays pay one JIT warmup for the threaded
+    build and the GIL-free prange loop after that.
+    """
+    global _parallel_kernel
+    if _parallel_kernel is None:
+        try:
+            from numba import njit, prange
+        except ImportError:
+            _parallel_kernel = False
+            return None
+        _parallel_kernel = njit(
+            KERNEL_SIGNATURE, parallel=True, nogil=True, cache=True
+        )(kernel_impl(prange))
+    return _parallel_kernel or None
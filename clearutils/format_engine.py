@@ -0,0 +1,403 @@
+"""
+Currency and percentage formatting for clearutils.
+
+Both helpers accept a single number or any of the usual containers (list,
+tuple, numpy array, pandas Series or DataFrame) and hand back nicely formatted
+strings in the same shape. Anything that isn't a number (text, NaN, None)
+passes through untouched, so you can format a whole messy column in one call.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from clearutils import _fmt_numba
+
+_default_currency_symbol = "$"
+
+# One-pass separator swap for European-style output, built once at import.
+_EURO_TRANS = str.maketrans({",": ".", ".": ","})
+
+
+@lru_cache(maxsize=32)
+def _format_spec(digit):
+    """Return the bound .format method for the grouped spec for `digit`.
+
+    Cached so repeated calls with the same digit reuse one compiled spec and
+    bound method instead of rebuilding the template string each time.
+    """
+    if digit > 0:
+        return ("{:,." + str(digit) + "f}").format
+    return "{:,}".format
+
+
+# Exact types seen on the hot scalar path. A set membership test on type(val)
+# is cheaper than scanning an isinstance tuple; anything not in the set falls
+# back to isinstance so int/float subclasses still format. bool is deliberately
+# absent: booleans pass through unformatted, like other non-numeric values.
+_NUMERIC_TYPES = frozenset({
+    int, float,
+    np.int8, np.int16, np.int32, np.int64,
+    np.uint8, np.uint16, np.uint32, np.uint64,
+    np.float16, np.float32, np.float64,
+})
+
+
+def _group_thousands(ints, sep):
+    """Group non-negative int64 values by thousands, fully vectorized.
+
+    Peels three-digit chunks off the whole array with integer division and
+    joins them with np.char passes, so the digit <= 0 paths never format an
+    element in Python. The lowest chunk of each value stays unpadded; chunks
+    that have more digits above them are zero-padded to three.
+    """
+    q = ints.copy()
+    rem = q % 1000
+    q //= 1000
+    more = q > 0
+    body = np.where(more, np.char.mod("%03d", rem), np.char.mod("%d", rem))
+    while more.any():
+        rem = q % 1000
+        q //= 1000
+        more_next = q > 0
+        piece = np.where(more_next, np.char.mod("%03d", rem), np.char.mod("%d", rem))
+        body = np.where(more, np.char.add(np.char.add(piece, sep), body), body)
+        more = more_next
+    return body
+
+
+def _format_array(arr, digit, prefix="", suffix="", use_euro=False, scale=1):
+    """Format a numeric ndarray in bulk, without a per-element Python loop.
+
+    Scales (for percentages), rounds, splits off the sign, and formats the
+    whole buffer with a handful of vectorized passes instead of calling the
+    scalar formatter once per element. NaNs are put back untouched at the
+    end. Returns an object ndarray of strings (NaN where the input was NaN).
+    """
+    a = np.asarray(arr, dtype=np.float64)
+    nan_mask = np.isnan(a)
+    work = a * scale if scale != 1 else a
+    # signbit vectorizes better than a compare against 0; mask out -0.0 so it
+    # keeps formatting without a sign, as the comparison did.
+    sign = np.where(np.signbit(work) & (work != 0.0), "-", "")
+    # np.abs hands back a temporary this function owns, so round in place.
+    rounded = np.abs(work)
+    np.round(rounded, digit, out=rounded)
+    if digit > 0:
+        fmt = _format_spec(digit)
+        if use_euro:
+            def formatter(x, _f=fmt, _t=_EURO_TRANS):
+                return _f(x).translate(_t)
+        else:
+            formatter = fmt
+        body = pd.Series(rounded).map(formatter).to_numpy(dtype="U")
+    else:
+        ready = np.where(nan_mask, 0.0, rounded)
+        # int64 cannot hold magnitudes >= 2**63 (or infinities); casting them
+        # is silent garbage, so zero them out of the fast path here and
+        # format them through the scalar fallback below.
+        oversize = ready >= 2.0 ** 63
+        if oversize.any():
+            ready[oversize] = 0.0
+        ints = ready.astype(np.int64)
+        body = _group_thousands(ints, "." if use_euro else ",")
+    out = np.char.add(np.char.add(sign, prefix), body)
+    if suffix:
+        out = np.char.add(out, suffix)
+    out = out.astype(object)
+    if digit <= 0 and oversize.any():
+        format_single = _make_scalar_formatter(digit, prefix=prefix,
+                                               suffix=suffix, use_euro=use_euro)
+        for idx in zip(*np.nonzero(oversize)):
+            out[idx] = format_single(work[idx])
+    if nan_mask.any():
+        out[nan_mask] = np.nan
+    return out
+
+
+# Below this size, ndarray conversion and kernel dispatch cost more than they
+# save; a plain map() with a precompiled format spec wins.
+_SMALL_SEQ_CUTOVER = 10_000
+
+
+def _format_sequence(seq, digit, prefix="", suffix="", use_euro=False):
+    """Format an all-numeric list/tuple without per-element Python dispatch.
+
+    Sequences at or past the cutover go through the numba kernel when it is
+    usable; everything else — small lists, numba missing, a digit or values
+    past the kernel's int64/row-width budget — shares one np.round-based
+    map() path, so the cutover and kernel availability never change how a
+    list rounds. Returns None only when the sequence holds non-numeric
+    values; the caller then falls back to the per-element formatter.
+    """
+    if not all(
+        isinstance(x, (int, float, np.number)) and type(x) is not bool
+        for x in seq
+    ):
+        return None
+    vals = np.fromiter(seq, dtype=np.float64, count=len(seq))
+    if (len(seq) >= _SMALL_SEQ_CUTOVER
+            and _fmt_numba.kernel_fits(max(digit, 0), prefix, suffix)):
+        # The kernel scales into int64: infinities and magnitudes past 2**63
+        # would overflow silently, so those sequences take the map path too.
+        largest = np.max(np.abs(vals), initial=0.0, where=np.isfinite(vals))
+        if (not np.isinf(vals).any()
+                and largest * 10.0 ** max(digit, 0) < 2.0 ** 63):
+            kernel = _fmt_numba.load_kernel()
+            if kernel is not None:
+                # Rounding can collapse small negatives to zero, so carry the
+                # sign as the sign bit of the rounded magnitude (the kernel
+                # reads it with signbit), mirroring _format_array's
+                # signbit & != 0 logic.
+                rounded = np.round(np.abs(vals), digit)
+                np.negative(rounded, out=rounded,
+                            where=np.signbit(vals) & (vals != 0.0))
+                thousands_sep, decimal_sep = (".", ",") if use_euro else (",", ".")
+                out = kernel(rounded, max(digit, 0), prefix, suffix,
+                             thousands_sep, decimal_sep)
+                # The kernel marks NaNs with ""; hand the originals back.
+                if np.isnan(vals).any():
+                    return [orig if s == "" else s for orig, s in zip(seq, out)]
+                return out
+    fmt = _format_spec(digit)
+    # np.round, not builtin round: the kernel rounds with np.round and the
+    # two disagree on some halfway values (2.675 at digit=2), so every
+    # fallback from the kernel lands here rather than on format_single.
+    nan_mask = np.isnan(vals)
+    has_nan = nan_mask.any()
+    rounded = np.round(np.abs(vals), digit)
+    if has_nan:
+        rounded[nan_mask] = 0.0
+    if digit > 0:
+        bodies = map(fmt, rounded.tolist())
+    else:
+        bodies = map(fmt, map(int, rounded.tolist()))
+    if use_euro:
+        bodies = (b.translate(_EURO_TRANS) for b in bodies)
+    out = [
+        ("-" if v < 0 else "") + prefix + b + suffix
+        for v, b in zip(seq, bodies)
+    ]
+    if has_nan:
+        return [orig if m else s for orig, m, s in zip(seq, nan_mask, out)]
+    return out
+
+
+def _format_frame(frame, format_single, digit, prefix="", suffix="",
+                  use_euro=False, scale=1):
+    """Format a DataFrame into one preallocated buffer.
+
+    Fills a single (nrows, ncols) object ndarray instead of building a fresh
+    Series per column and letting pandas concatenate them: the numeric block
+    goes through one flat _format_array pass, non-numeric columns through the
+    per-element fallback, and the DataFrame is constructed once at the end
+    without copying the buffer.
+    """
+    out = np.empty(frame.shape, dtype=object)
+    # Match numeric columns by position, not label: duplicate column names
+    # are legal pandas and name-based selection would misalign the block.
+    positions = [
+        j for j, dt in enumerate(frame.dtypes)
+        if pd.api.types.is_numeric_dtype(dt) and not pd.api.types.is_bool_dtype(dt)
+    ]
+    if positions:
+        # One flat pass over the whole numeric block beats a Series.map per
+        # column; column-major order keeps each column contiguous.
+        block = frame.iloc[:, positions].to_numpy(dtype=np.float64)
+        shaped = _format_array(
+            block.ravel(order="F"), digit, prefix=prefix, suffix=suffix,
+            use_euro=use_euro, scale=scale,
+        ).reshape(block.shape, order="F")
+        for k, j in enumerate(positions):
+            out[:, j] = shaped[:, k]
+    numeric_positions = set(positions)
+    for j, (name, col) in enumerate(frame.items()):
+        if j not in numeric_positions:
+            out[:, j] = col.map(format_single).to_numpy()
+    return pd.DataFrame(out, index=frame.index, columns=frame.columns, copy=False)
+
+
+def _make_scalar_formatter(digit, prefix="", suffix="", use_euro=False, scale=1):
+    """Build the per-element formatter specialized for one call's options.
+
+    `digit`, the separators, and the prefix are fixed for a whole
+    format_currency/format_percent call, so pick the digit branch and compile
+    the format spec once here. The returned closure carries everything as
+    default arguments (local loads) instead of re-reading free variables and
+    re-evaluating the digit branches per element.
+    """
+    num_types = (int, float, np.number)
+    body = _format_spec(digit)
+    if digit > 0:
+
+        def format_single(val, _types=_NUMERIC_TYPES, _num=num_types,
+                          _body=body, _digit=digit, _prefix=prefix,
+                          _suffix=suffix, _euro=use_euro, _scale=scale):
+            if type(val) not in _types:
+                # bool subclasses int, so test it before the subclass check.
+                if isinstance(val, bool) or not isinstance(val, _num):
+                    return val
+            if val != val:  # NaN: one float compare vs pd.isna's dispatch
+                return val
+            v = float(val) * _scale
+            s = _body(round(abs(v), _digit))
+            if _euro:
+                s = s.translate(_EURO_TRANS)
+            return ("-" if v < 0 else "") + _prefix + s + _suffix
+    else:
+
+        def format_single(val, _types=_NUMERIC_TYPES, _num=num_types,
+                          _body=body, _digit=digit, _prefix=prefix,
+                          _suffix=suffix, _euro=use_euro, _scale=scale):
+            if type(val) not in _types:
+                # bool subclasses int, so test it before the subclass check.
+                if isinstance(val, bool) or not isinstance(val, _num):
+                    return val
+            if val != val:  # NaN: one float compare vs pd.isna's dispatch
+                return val
+            v = float(val) * _scale
+            s = _body(int(round(abs(v), _digit)))
+            if _euro:
+                s = s.translate(_EURO_TRANS)
+            return ("-" if v < 0 else "") + _prefix + s + _suffix
+    return format_single
+
+
+# Built once at import so format_currency doesn't rebuild it on every call.
+_SYMBOLS = {
+    "USD": "$", "EUR": "€", "GBP": "£", "JPY": "¥", "CNY": "¥",
+    "KRW": "₩", "INR": "₹", "RUB": "₽", "TRY": "₺", "ILS": "₪",
+    "THB": "฿", "VND": "₫", "PHP": "₱", "NGN": "₦", "UAH": "₴",
+    "CRC": "₡", "PYG": "₲", "GHS": "₵", "KZT": "₸", "AZN": "₼",
+    "CAD": "CA$", "AUD": "A$", "NZD": "NZ$", "HKD": "HK$", "SGD": "S$",
+    "TWD": "NT$", "MXN": "MX$", "BRL": "R$", "ARS": "AR$", "CLP": "CL$",
+    "COP": "CO$", "CHF": "CHF", "SEK": "kr", "NOK": "kr", "DKK": "kr",
+    "ISK": "kr", "PLN": "zł", "CZK": "Kč", "HUF": "Ft", "ZAR": "R",
+    "AED": "د.إ", "SAR": "﷼",
+}
+
+
+@lru_cache(maxsize=64)
+def _resolve_prefix(symbol):
+    """Map a currency code to its display prefix, memoized per code."""
+    return _SYMBOLS.get(symbol.upper(), symbol)
+
+
+def get_supported_currency_symbols():
+    """Return the mapping of supported ISO currency codes to display symbols.
+
+    Pass any of these codes as `symbol` to `format_currency`. Codes that are
+    not in the mapping are used as the prefix verbatim.
+    """
+    return _SYMBOLS.copy()
+
+
+def format_currency(amount, digit=0, symbol="USD", use_euro=False):
+    """Format number(s) as currency strings.
+
+    `amount` can be a single number, a list/tuple, a numpy array, or a pandas
+    Series/DataFrame. `digit` is how many decimal places to keep (negative
+    rounds to tens, hundreds, ...). `symbol` is an ISO code from
+    `get_supported_currency_symbols` (or any literal prefix). Set `use_euro`
+    for European-style separators (1.234,56).
+
+        format_currency(12345.67)          ->  "$12,346"
+        format_currency(1234.567, 2)       ->  "$1,234.57"
+        format_currency(1234.5, 2, "EUR")  ->  "€1,234.50"
+
+    Series inputs come back as a pandas Series of string dtype with the index
+    preserved; lists, tuples, and numpy arrays come back as a list.
+    Non-numeric values (text, NaN, None) are returned unchanged.
+    """
+    if isinstance(amount, (list, tuple, np.ndarray)) and len(amount) == 0:
+        return []
+    if isinstance(amount, pd.Series) and len(amount) == 0:
+        return pd.Series([], index=amount.index, name=amount.name, dtype="string")
+    if isinstance(amount, pd.DataFrame) and amount.empty:
+        return amount.copy()
+    prefix = _resolve_prefix(symbol) if symbol else _default_currency_symbol
+    format_single = _make_scalar_formatter(digit, prefix=prefix, use_euro=use_euro)
+
+    if isinstance(amount, pd.DataFrame):
+        return _format_frame(amount, format_single, digit, prefix=prefix,
+                             use_euro=use_euro)
+    if isinstance(amount, pd.Series):
+        # bool counts as numeric to pandas, but booleans pass through the
+        # per-element path (and the DataFrame path) unformatted.
+        if (pd.api.types.is_numeric_dtype(amount)
+                and not pd.api.types.is_bool_dtype(amount)):
+            vals = amount.to_numpy(dtype=np.float64, na_value=np.nan)
+            return pd.Series(
+                _format_array(vals, digit, prefix=prefix, use_euro=use_euro),
+                index=amount.index, name=amount.name, dtype="string",
+            )
+        return pd.Series([format_single(x) for x in amount],
+                         index=amount.index, name=amount.name)
+    if isinstance(amount, np.ndarray):
+        if np.issubdtype(amount.dtype, np.number):
+            return list(_format_array(amount, digit, prefix=prefix, use_euro=use_euro))
+        return [format_single(x) for x in amount]
+    if isinstance(amount, (list, tuple)):
+        fast = _format_sequence(amount, digit, prefix=prefix, use_euro=use_euro)
+        if fast is not None:
+            return fast
+        return [format_single(x) for x in amount]
+    return format_single(amount)
+
+
+def format_percent(value, digit=1, use_euro=False):
+    """Format fraction(s) as percentage strings.
+
+    `value` can be a single number, a list/tuple, a numpy array, or a pandas
+    Series/DataFrame. Fractions are multiplied by 100, so 0.135 becomes
+    "13.5%". `digit` is how many decimal places to keep. Set `use_euro` for
+    European-style separators.
+
+        format_percent(0.13486)     ->  "13.5%"
+        format_percent(0.13486, 2)  ->  "13.49%"
+
+    Series inputs come back as a pandas Series of string dtype with the index
+    preserved; lists, tuples, and numpy arrays come back as a list.
+    Non-numeric values (text, NaN, None) are returned unchanged.
+    """
+
+    if isinstance(value, (list, tuple, np.ndarray)) and len(value) == 0:
+        return []
+    if isinstance(value, pd.Series) and len(value) == 0:
+        return pd.Series([], index=value.index, name=value.name, dtype="string")
+    if isinstance(value, pd.DataFrame) and value.empty:
+        return value.copy()
+    format_single = _make_scalar_formatter(digit, suffix="%", use_euro=use_euro, scale=100)
+
+    if isinstance(value, pd.DataFrame):
+        return _format_frame(value, format_single, digit, suffix="%",
+                             use_euro=use_euro, scale=100)
+    if isinstance(value, pd.Series):
+        # bool counts as numeric to pandas, but booleans pass through the
+        # per-element path (and the DataFrame path) unformatted.
+        if (pd.api.types.is_numeric_dtype(value)
+                and not pd.api.types.is_bool_dtype(value)):
+            vals = value.to_numpy(dtype=np.float64, na_value=np.nan)
+            return pd.Series(
+                _format_array(vals, digit, suffix="%", use_euro=use_euro, scale=100),
+                index=value.index, name=value.name, dtype="string",
+            )
+        return pd.Series([format_single(x) for x in value],
+                         index=value.index, name=value.name)
+    if isinstance(value, np.ndarray):
+        if np.issubdtype(value.dtype, np.number):
+            return list(_format_array(value, digit, suffix="%", use_euro=use_euro, scale=100))
+        return [format_single(x) for x in value]
+    if isinstance(value, (list, tuple)):
+        scaled = [
+            v * 100
+            if isinstance(v, (int, float, np.number)) and not isinstance(v, bool)
+            else v
+            for v in value
+        ]
+        fast = _format_sequence(scaled, digit, suffix="%", use_euro=use_euro)
+        if fast is not None:
+            return fast
+        return [format_single(x) for x in value]
+    return format_single(value)
@@ -0,0 +1,49 @@
+"""
+Logging helpers for clearutils.
+
+Flat-style helpers that wrap long messages with indents so logs stay readable,
+plus a formatted traceback printer. Everything a script needs is passed as an
+argument—no hidden state.
+"""
+
+import logging
+import textwrap
+import traceback
+
+_default_width = 100
+_default_indent = "    "
+_logger_name = "clearutils"
+
+
+def setup_logging(log_path=None, level=logging.INFO, mode="w"):
+    """Set up simple, readable logging for a script.
+
+    Logs to the console, and also to `log_path` if one is given. Returns the
+    logger so you can pass it around, though the other helpers find it by name.
+    """
+    handlers = [logging.StreamHandler()]
+    if log_path:
+        handlers.append(logging.FileHandler(log_path, mode=mode, encoding="utf-8"))
+    logging.basicConfig(level=level, format="%(message)s", handlers=handlers, force=True)
+    return logging.getLogger(_logger_name)
+
+
+def logw(message, width=_default_width, indent=_default_indent, level=logging.INFO):
+    """Log a message, wrapped to `width` with continuation lines indented."""
+    wrapped = textwrap.fill(str(message), width=width, subsequent_indent=indent)
+    logging.getLogger(_logger_name).log(level, wrapped)
+
+
+def logw_traceback(exc, width=_default_width, indent=_default_indent, level=logging.ERROR):
+    """Log a clear, formatted traceback for an exception."""
+    lines = traceback.format_exception(type(exc), exc, exc.__traceback__)
+    logger = logging.getLogger(_logger_name)
+    for line in "".join(lines).rstrip().splitlines():
+        logger.log(level, textwrap.fill(line, width=width, subsequent_indent=indent))
+
+
+def flush_logs():
+    """Flush all handlers so log files are complete before a script exits."""
+    for logger in (logging.getLogger(_logger_name), logging.getLogger()):
+        for handler in logger.handlers:
+            handler.flush()
@@ -0,0 +1,168 @@
+"""Tests for clearutils.format_engine."""
+
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from clearutils import format_currency, format_percent
+from clearutils.format_engine import get_supported_currency_symbols
+
+
+# ---------------------- Currency formatting ----------------------
+
+def test_currency_scalar_default():
+    assert format_currency(12345.67) == "$12,346"
+
+
+def test_currency_scalar_digits():
+    assert format_currency(1234.567, 2) == "$1,234.57"
+
+
+def test_currency_negative():
+    assert format_currency(-89.5, 2) == "-$89.50"
+
+
+def test_currency_negative_digit():
+    assert format_currency(1234567, -3) == "$1,235,000"
+
+
+def test_currency_symbol():
+    assert format_currency(5, symbol="EUR") == "€5"
+    assert format_currency(5, symbol="gbp") == "£5"
+
+
+def test_currency_unknown_symbol_passthrough():
+    assert format_currency(5, symbol="XXX") == "XXX5"
+
+
+def test_currency_euro_style():
+    assert format_currency(1234.5, 2, use_euro=True) == "$1.234,50"
+
+
+def test_currency_non_numeric_passthrough():
+    assert format_currency("hello") == "hello"
+    assert math.isnan(format_currency(float("nan")))
+
+
+def test_currency_list():
+    assert format_currency([1234.567, -89.5], 2) == ["$1,234.57", "-$89.50"]
+
+
+def test_currency_ndarray():
+    arr = np.array([1234.567, -89.5, 0.045])
+    assert format_currency(arr, 2) == ["$1,234.57", "-$89.50", "$0.04"]
+
+
+def test_currency_list_rounding_matches_kernel():
+    # Halfway value where builtin round and np.round disagree; both sides of
+    # the large-list cutover must format it the same way.
+    assert format_currency([2.675], 2) == ["$2.68"]
+
+
+def test_currency_list_rounding_without_kernel(monkeypatch):
+    # With the kernel unavailable, large lists must still round like small
+    # ones instead of dropping to the builtin-round scalar fallback.
+    from clearutils import _fmt_numba
+
+    monkeypatch.setattr(_fmt_numba, "load_kernel", lambda: None)
+    out = format_currency([2.675] * 10001, 2)
+    assert out[0] == "$2.68"
+
+
+def test_currency_ndarray_huge_values():
+    # Values past int64 range must not be crushed by the integer fast path.
+    out = format_currency(np.array([1e19, -1.0]), 0)
+    assert out == ["$10,000,000,000,000,000,000", "-$1"]
+
+
+def test_currency_series():
+    ser = pd.Series([1234.567, -89.5], index=["x", "y"], name="amt")
+    out = format_currency(ser, 2)
+    assert isinstance(out, pd.Series)
+    assert out.dtype == "string"
+    assert list(out.index) == ["x", "y"] and out.name == "amt"
+    assert list(out) == ["$1,234.57", "-$89.50"]
+
+
+def test_currency_bool_passthrough():
+    assert format_currency(True) is True
+    assert format_currency([True, False]) == [True, False]
+    ser = pd.Series([True, False])
+    assert list(format_currency(ser)) == [True, False]
+    df = pd.DataFrame({"b": [True, False]})
+    assert list(format_currency(df)["b"]) == [True, False]
+    assert format_percent([True, False, 0.5], 1) == [True, False, "50.0%"]
+
+
+def test_currency_dataframe():
+    df = pd.DataFrame({"a": [1234.5, 2.0], "b": [-3.25, 0.0]})
+    out = format_currency(df, 2)
+    assert list(out["a"]) == ["$1,234.50", "$2.00"]
+    assert list(out["b"]) == ["-$3.25", "$0.00"]
+
+
+def test_currency_large_list_kernel():
+    from clearutils import _fmt_numba
+
+    if _fmt_numba.load_kernel() is None:
+        pytest.skip("numba kernel unavailable")
+    # Crosses the 10,000-element cutover so the kernel path actually runs.
+    data = [-0.4, float("nan"), 1234.567] * 4000
+    out = format_currency(data, 0)
+    assert out[0] == "-$0"
+    assert math.isnan(out[1])
+    assert out[2] == "$1,235"
+    out2 = format_currency(data, 2)
+    assert out2[0] == "-$0.40"
+    assert out2[2] == "$1,234.57"
+
+
+def test_currency_dataframe_duplicate_columns():
+    df = pd.DataFrame([[1.0, "x"], [2.5, "y"]], columns=["a", "a"])
+    out = format_currency(df, 2)
+    assert list(out.iloc[:, 0]) == ["$1.00", "$2.50"]
+    assert list(out.iloc[:, 1]) == ["x", "y"]
+
+
+def test_supported_symbols_mapping():
+    symbols = get_supported_currency_symbols()
+    assert symbols["USD"] == "$"
+    assert symbols["JPY"] == "¥"
+
+
+# ---------------------- Percentage formatting ----------------------
+
+def test_percent_scalar_default():
+    assert format_percent(0.13486) == "13.5%"
+
+
+def test_percent_scalar_digits():
+    assert format_percent(0.13486, 2) == "13.49%"
+
+
+def test_percent_zero_digit():
+    assert format_percent(0.1234, 0) == "12%"
+
+
+def test_percent_negative():
+    assert format_percent(-0.25, 1) == "-25.0%"
+
+
+def test_percent_ndarray():
+    arr = np.array([0.1, -0.255])
+    assert format_percent(arr, 1) == ["10.0%", "-25.5%"]
+
+
+def test_percent_non_numeric_passthrough():
+    assert format_percent("n/a") == "n/a"
+
+
+def test_empty_inputs():
+    assert format_currency([]) == []
+    assert format_currency(np.array([]), 2) == []
+    empty = format_percent(pd.Series([], dtype=float))
+    assert isinstance(empty, pd.Series) and empty.empty
+    out = format_currency(pd.DataFrame({"a": []}))
+    assert out.empty and list(out.columns) == ["a"]
@@ -0,0 +1,35 @@
+"""
+Build the optional AOT-compiled formatting kernel for clearutils.
+
+Usage:
+
+    python tools/build_aot.py
+
+Writes a `_fmt_aot` extension module into the clearutils package directory.
+When it is present, `clearutils._fmt_numba.load_kernel()` picks it up and
+bulk formatting pays no JIT warmup on first call. Requires numba (and a
+working C toolchain) at build time only; the built module needs neither.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from numba.pycc import CC
+
+from clearutils import _fmt_numba
+
+
+def main():
+    cc = CC("_fmt_aot")
+    cc.output_dir = os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "..", "clearutils"
+    )
+    cc.export("format_fixed", _fmt_numba.KERNEL_SIGNATURE)(_fmt_numba.kernel_impl())
+    cc.compile()
+    print(f"Built _fmt_aot in {cc.output_dir}")
+
+
+if __name__ == "__main__":
+    main()